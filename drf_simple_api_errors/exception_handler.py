@@ -27,15 +27,16 @@ def exception_handler(exc, context):
     will cause a 500 error response.
     """
 
-    if isinstance(exc, DjangoValidationError):
-        exc = exceptions.ValidationError(as_serializer_error(exc))
-
-    if isinstance(exc, Http404):
-        exc = exceptions.NotFound()
-
-    if isinstance(exc, PermissionDenied):
-        exc = exceptions.PermissionDenied()
+    # REST framework exceptions are the common case and need no conversion
+    if not isinstance(exc, exceptions.APIException):
+        if isinstance(exc, DjangoValidationError):
+            exc = exceptions.ValidationError(as_serializer_error(exc))
+        elif isinstance(exc, Http404):
+            exc = exceptions.NotFound()
+        elif isinstance(exc, PermissionDenied):
+            exc = exceptions.PermissionDenied()
 
+    # imported once and cached by `api_settings` until the settings change
     extra_handlers = api_settings.EXTRA_HANDLERS
     if extra_handlers:
         for handler in extra_handlers:
@@ -50,10 +51,12 @@ def exception_handler(exc, context):
     # from DRF
     # https://github.com/encode/django-rest-framework/blob/48a21aa0eb3a95d32456c2a927eff9552a04231e/rest_framework/views.py#L87-L91
     headers = {}
-    if getattr(exc, "auth_header", None):
-        headers["WWW-Authenticate"] = exc.auth_header
-    if getattr(exc, "wait", None):
-        headers["Retry-After"] = "%d" % exc.wait
+    auth_header = getattr(exc, "auth_header", None)
+    if auth_header:
+        headers["WWW-Authenticate"] = auth_header
+    wait = getattr(exc, "wait", None)
+    if wait:
+        headers["Retry-After"] = str(int(wait))
 
     data = {}
     if isinstance(exc.detail, (list, dict)) and isinstance(
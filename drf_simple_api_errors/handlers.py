@@ -1,4 +1,3 @@
-import copy
 import logging
 from typing import Dict, List, Union
 
@@ -18,7 +17,7 @@ def exc_detail_handler(data: Dict, exc_detail: Union[Dict, List]) -> Dict:
     If the `exc_detail` is a dictionary, it will set to the `data` dictionary.
     If the `exc_detail` is a list, it will be set to the `data` dictionary.
     """
-    logger.debug("`exc_detail` is instance of %s" % type(exc_detail))
+    logger.debug("`exc_detail` is instance of %s", type(exc_detail))
 
     if isinstance(exc_detail, dict):
         __exc_detail_as_dict_handler(data, exc_detail)
@@ -30,30 +29,25 @@ def exc_detail_handler(data: Dict, exc_detail: Union[Dict, List]) -> Dict:
 
 def __exc_detail_as_dict_handler(data: Dict, exc_detail: Dict):
     """Handle the exception detail as a dictionary."""
-    exc_detail = flatten_dict(copy.deepcopy(exc_detail))
+    # `flatten_dict` builds a new dictionary, so `exc_detail` is never mutated
+    flat_exc_detail = flatten_dict(exc_detail)
 
-    invalid_params = []
+    # REST framework details are lists of errors already,
+    # so only wrap the odd single error
     non_field_errors = []
-    for field, error in exc_detail.items():
-        error_detail = {}
-
-        reason = error if not isinstance(error, list) or len(error) > 1 else error[0]
-
-        if field in {drf_api_settings.NON_FIELD_ERRORS_KEY, "__all__"}:
-            if isinstance(reason, list):
-                non_field_errors.extend(reason)
-            else:
-                non_field_errors.append(reason)
-        else:
-            error_detail["name"] = (
-                field if not api_settings.CAMELIZE else camelize(field)
-            )
-            if isinstance(reason, list):
-                error_detail["reason"] = reason
-            else:
-                error_detail["reason"] = [reason]
-
-            invalid_params.append(error_detail)
+    for key in (drf_api_settings.NON_FIELD_ERRORS_KEY, "__all__"):
+        if key in flat_exc_detail:
+            error = flat_exc_detail.pop(key)
+            non_field_errors.extend(error if isinstance(error, list) else [error])
+
+    camelize_field = api_settings.CAMELIZE
+    invalid_params = [
+        {
+            "name": field if not camelize_field else camelize(field),
+            "reason": error if isinstance(error, list) else [error],
+        }
+        for field, error in flat_exc_detail.items()
+    ]
 
     if invalid_params:
         data["invalid_params"] = invalid_params
@@ -64,9 +58,9 @@ def __exc_detail_as_dict_handler(data: Dict, exc_detail: Dict):
 
 def __exc_detail_as_list_handler(data: Dict, exc_detail: List):
     """Handle the exception detail as a list."""
-    detail = []
-    for error in exc_detail:
-        detail.append(error if not isinstance(error, list) else error[0])
+    detail = [
+        error if not isinstance(error, list) else error[0] for error in exc_detail
+    ]
 
     if detail:
         data["detail"] = detail
@@ -74,9 +68,13 @@ def __exc_detail_as_list_handler(data: Dict, exc_detail: List):
 
 def is_exc_detail_same_as_default_detail(exc: APIException) -> bool:
     """Check if the exception detail is the same as the default detail."""
-    return (isinstance(exc.detail, str) and exc.detail == exc.default_detail) or (
-        isinstance(exc.detail, list)
-        and len(exc.detail) == 1
-        and isinstance(exc.detail[0], str)
-        and exc.detail[0] == exc.default_detail
-    )
+    detail = exc.detail
+    if isinstance(detail, list) and len(detail) == 1:
+        detail = detail[0]
+
+    if not isinstance(detail, str):
+        return False
+
+    # `default_detail` is usually a lazy translation,
+    # cast it once instead of on each comparison
+    return detail == str(exc.default_detail)
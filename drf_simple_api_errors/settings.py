@@ -1,8 +1,7 @@
 from django.conf import settings
+from django.core.signals import setting_changed
 from rest_framework.settings import APISettings
 
-USER_SETTINGS = getattr(settings, "DRF_SIMPLE_API_ERRORS", {})
-
 DEFAULTS = {
     "CAMELIZE": False,
     "EXTRA_HANDLERS": [],
@@ -12,4 +11,28 @@ DEFAULTS = {
 # List of settings that may be in string import notation
 IMPORT_STRINGS = ("EXTRA_HANDLERS", "CAMELIZE")
 
-api_settings = APISettings(USER_SETTINGS, DEFAULTS, IMPORT_STRINGS)
+
+class DRFSimpleAPIErrorsSettings(APISettings):
+    """
+    DRF `APISettings` reading from the `DRF_SIMPLE_API_ERRORS` namespace.
+
+    Setting values are resolved once and cached on the instance,
+    the cache is cleared whenever `DRF_SIMPLE_API_ERRORS` changes.
+    """
+
+    @property
+    def user_settings(self):
+        if not hasattr(self, "_user_settings"):
+            self._user_settings = getattr(settings, "DRF_SIMPLE_API_ERRORS", {})
+        return self._user_settings
+
+
+api_settings = DRFSimpleAPIErrorsSettings(None, DEFAULTS, IMPORT_STRINGS)
+
+
+def reload_api_settings(*args, **kwargs):
+    if kwargs["setting"] == "DRF_SIMPLE_API_ERRORS":
+        api_settings.reload()
+
+
+setting_changed.connect(reload_api_settings)
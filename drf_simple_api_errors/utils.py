@@ -1,20 +1,28 @@
-import re
+import string
 
 from .settings import api_settings
 
+# characters that get uppercased (and lose their underscore) when following "_"
+_CAMELIZE_CHARS = frozenset(string.ascii_lowercase + string.digits)
+
 
 def camelize(field: str) -> str:
     """Convert a snake_case string to camelCase."""
+    if "_" not in field:
+        return field
+
+    head, *tail = field.split("_")
 
-    def underscore_to_camel(match: re.Match) -> str:
-        group = match.group()
-        if len(group) == 3:
-            return group[0] + group[2].upper()
+    camelized = head
+    for part in tail:
+        # drop the underscore only when it is followed by a lowercase letter
+        # or a digit, any other underscore (e.g. doubled or trailing) is kept
+        if part[:1] in _CAMELIZE_CHARS:
+            camelized += part[0].upper() + part[1:]
         else:
-            return group[1].upper()
+            camelized += "_" + part
 
-    camelize_re = re.compile(r"[a-z0-9]?_[a-z0-9]")
-    return re.sub(camelize_re, underscore_to_camel, field)
+    return camelized
 
 
 def flatten_dict(data: dict, parent_key: str = "") -> dict:
@@ -24,12 +32,19 @@ def flatten_dict(data: dict, parent_key: str = "") -> dict:
     """
     sep = api_settings.FIELDS_SEPARATOR
 
-    items: list = []
-    for k, v in data.items():
-        flat_k = sep.join([parent_key, k]) if parent_key and sep else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, flat_k).items())
+    flat: dict = {}
+    # walk the nested dictionaries depth-first with a stack of item iterators,
+    # so that keys keep the same order they have in the original dictionary
+    stack = [(parent_key, iter(data.items()))]
+    while stack:
+        key, items = stack[-1]
+        for k, v in items:
+            flat_k = f"{key}{sep}{k}" if key and sep else k
+            if isinstance(v, dict):
+                stack.append((flat_k, iter(v.items())))
+                break
+            flat[flat_k] = v
         else:
-            items.append((flat_k, v))
+            stack.pop()
 
-    return dict(items)
+    return flat
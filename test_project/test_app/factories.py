@@ -1,18 +1,16 @@
 from django.contrib.auth import get_user_model
 
 import factory
-from faker import Faker
 
 from test_app.models import Book, Library
 
-faker = Faker()
-
 
 class BookFactory(factory.django.DjangoModelFactory):
-    # slice not to exceed max_length
-    isbn10 = factory.LazyAttribute(lambda _: faker.unique.isbn10())
-    pages = factory.LazyAttribute(lambda _: faker.pyint(max_value=360))
-    title = factory.LazyAttribute(lambda _: faker.word()[:32])
+    # a sequence is unique by construction and never collides with
+    # the "X" check digit isbn10 values built by `book_data` in tests
+    isbn10 = factory.Sequence(lambda n: f"{n:010d}")
+    pages = factory.Faker("pyint", max_value=360)
+    title = factory.Faker("pystr", max_chars=32)
 
     class Meta:
         model = Book
@@ -24,7 +22,7 @@ class LibraryFactory(factory.django.DjangoModelFactory):
 
 
 class UserFactory(factory.django.DjangoModelFactory):
-    username = factory.LazyAttribute(lambda _: faker.unique.user_name())
+    username = factory.Sequence(lambda n: f"user_{n}")
 
     class Meta:
         model = get_user_model()
@@ -1,11 +1,85 @@
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.http import Http404
+from django.test import override_settings
 from rest_framework import exceptions
 
 import pytest
 
 from drf_simple_api_errors import exception_handler, utils
-from test_app.utils import ErrorTriggers, render_response
+from test_app.factories import LibraryFactory
+from test_app.utils import ErrorTriggers, book_data, render_response
+
+# error messages with the expected response data, except for the title
+# which depends on the exception raised
+ERROR_MESSAGES = [
+    (
+        "Error message.",
+        {"detail": ["Error message."]},
+    ),
+    (
+        [f"Error message {i}." for i in range(2)],
+        {"detail": ["Error message 0.", "Error message 1."]},
+    ),
+    (
+        {"field": "Error message."},
+        {"invalid_params": [{"name": "field", "reason": ["Error message."]}]},
+    ),
+    (
+        {
+            "non_field_errors": [f"Error message {i}." for i in range(2)],
+            "field": [f"Error message {i}." for i in range(2)],
+        },
+        {
+            "detail": ["Error message 0.", "Error message 1."],
+            "invalid_params": [
+                {"name": "field", "reason": ["Error message 0.", "Error message 1."]}
+            ],
+        },
+    ),
+]
+
+# Django's `ValidationError` does not support nested dictionaries
+NESTED_ERROR_MESSAGES = [
+    (
+        {"field1": {"field2": "Error message."}},
+        {"invalid_params": [{"name": "field1.field2", "reason": ["Error message."]}]},
+    ),
+    (
+        {"field1": {"field2": {"field3": {"field4": {"field5": "Error message."}}}}},
+        {
+            "invalid_params": [
+                {
+                    "name": "field1.field2.field3.field4.field5",
+                    "reason": ["Error message."],
+                }
+            ]
+        },
+    ),
+    (
+        {
+            "field1": {"field2": "Error message."},
+            "field3": {"field4": "Error message."},
+        },
+        {
+            "invalid_params": [
+                {"name": "field1.field2", "reason": ["Error message."]},
+                {"name": "field3.field4", "reason": ["Error message."]},
+            ]
+        },
+    ),
+    (
+        {
+            "field1": {"field2": "Error message."},
+            "field3": {"field4": {"field5": "Error message."}},
+        },
+        {
+            "invalid_params": [
+                {"name": "field1.field2", "reason": ["Error message."]},
+                {"name": "field3.field4.field5", "reason": ["Error message."]},
+            ]
+        },
+    ),
+]
 
 
 @pytest.mark.django_db
@@ -26,151 +100,68 @@ class TestErrors:
         }
         assert render_response(response.data) == expected_response
 
-    @pytest.mark.parametrize(
-        "error_message, expected_response",
-        [
-            (
-                "Error message.",
-                {"title": "Validation error.", "detail": ["Error message."]},
-            ),
-            (
-                [f"Error message {i}." for i in range(2)],
-                {
-                    "title": "Validation error.",
-                    "detail": ["Error message 0.", "Error message 1."],
-                },
-            ),
-            (
-                {"field": "Error message."},
-                {
-                    "title": "Validation error.",
-                    "invalid_params": [{"name": "field", "reason": ["Error message."]}],
-                },
-            ),
-        ],
-    )
-    def test_django_validation_error_ok(self, error_message, expected_response, mocker):
+    @pytest.mark.parametrize("error_message, expected_data", ERROR_MESSAGES)
+    def test_django_validation_error_ok(self, error_message, expected_data, mocker):
         exc = ValidationError(error_message)
         response = exception_handler(exc, mocker.Mock())
 
+        expected_response = {"title": "Validation error.", **expected_data}
         assert render_response(response.data) == expected_response
 
+    def test_drf_throttled_ok(self, mocker):
+        exc = exceptions.Throttled(wait=59.5)
+        response = exception_handler(exc, mocker.Mock())
+
+        expected_response = {
+            "title": "Request was throttled.",
+            "detail": ["Request was throttled. Expected available in 60 seconds."],
+        }
+        assert render_response(response.data) == expected_response
+        assert response["Retry-After"] == "60"
+
     @pytest.mark.parametrize(
-        "error_message, expected_response",
+        "exc_class, title",
         [
-            (
-                "Error message.",
-                {"title": "A server error occurred.", "detail": ["Error message."]},
-            ),
-            (
-                [f"Error message {i}." for i in range(2)],
-                {
-                    "title": "A server error occurred.",
-                    "detail": ["Error message 0.", "Error message 1."],
-                },
-            ),
-            (
-                {"field": "Error message."},
-                {
-                    "title": "A server error occurred.",
-                    "invalid_params": [{"name": "field", "reason": ["Error message."]}],
-                },
-            ),
-            (
-                {"field1": {"field2": "Error message."}},
-                {
-                    "title": "A server error occurred.",
-                    "invalid_params": [
-                        {"name": "field1.field2", "reason": ["Error message."]}
-                    ],
-                },
-            ),
+            (exceptions.APIException, "A server error occurred."),
+            (exceptions.ValidationError, "Validation error."),
         ],
     )
-    def test_drf_api_exception_ok(self, error_message, expected_response, mocker):
-        exc = exceptions.APIException(error_message)
+    @pytest.mark.parametrize(
+        "error_message, expected_data", ERROR_MESSAGES + NESTED_ERROR_MESSAGES
+    )
+    def test_drf_exception_ok(
+        self, exc_class, title, error_message, expected_data, mocker
+    ):
+        exc = exc_class(error_message)
         response = exception_handler(exc, mocker.Mock())
 
+        expected_response = {"title": title, **expected_data}
         assert render_response(response.data) == expected_response
 
-    @pytest.mark.parametrize(
-        "error_message, expected_response",
-        [
-            (
-                "Error message.",
-                {"title": "Validation error.", "detail": ["Error message."]},
-            ),
-            (
-                [f"Error message {i}." for i in range(2)],
-                {
-                    "title": "Validation error.",
-                    "detail": ["Error message 0.", "Error message 1."],
-                },
-            ),
-            (
-                {"field": "Error message."},
-                {
-                    "title": "Validation error.",
-                    "invalid_params": [{"name": "field", "reason": ["Error message."]}],
-                },
-            ),
-            (
-                {"field1": {"field2": "Error message."}},
-                {
-                    "title": "Validation error.",
-                    "invalid_params": [
-                        {"name": "field1.field2", "reason": ["Error message."]}
-                    ],
-                },
-            ),
-            (
-                {
-                    "field1": {
-                        "field2": {"field3": {"field4": {"field5": "Error message."}}}
-                    }
-                },
-                {
-                    "title": "Validation error.",
-                    "invalid_params": [
-                        {
-                            "name": "field1.field2.field3.field4.field5",
-                            "reason": ["Error message."],
-                        }
-                    ],
-                },
-            ),
-            (
-                {
-                    "field1": {"field2": "Error message."},
-                    "field3": {"field4": "Error message."},
-                },
-                {
-                    "title": "Validation error.",
-                    "invalid_params": [
-                        {"name": "field1.field2", "reason": ["Error message."]},
-                        {"name": "field3.field4", "reason": ["Error message."]},
-                    ],
-                },
-            ),
-            (
-                {
-                    "field1": {"field2": "Error message."},
-                    "field3": {"field4": {"field5": "Error message."}},
-                },
-                {
-                    "title": "Validation error.",
-                    "invalid_params": [
-                        {"name": "field1.field2", "reason": ["Error message."]},
-                        {"name": "field3.field4.field5", "reason": ["Error message."]},
-                    ],
-                },
-            ),
-        ],
+    @override_settings(
+        DRF_SIMPLE_API_ERRORS={"CAMELIZE": True, "FIELDS_SEPARATOR": "/"}
     )
-    def test_drf_validation_error_ok(self, error_message, expected_response, mocker):
-        exc = exceptions.ValidationError(error_message)
+    def test_drf_validation_error_with_settings_ok(self, mocker):
+        exc = exceptions.ValidationError(
+            {"first_name": "Error message.", "address": {"zip_code": "Error message."}}
+        )
         response = exception_handler(exc, mocker.Mock())
 
+        expected_response = {
+            "title": "Validation error.",
+            "invalid_params": [
+                {"name": "firstName", "reason": ["Error message."]},
+                {"name": "address/zipCode", "reason": ["Error message."]},
+            ],
+        }
+        assert render_response(response.data) == expected_response
+
+    @override_settings(DRF_SIMPLE_API_ERRORS={"EXTRA_HANDLERS": None})
+    def test_extra_handlers_none_ok(self, mocker):
+        exc = Http404()
+        response = exception_handler(exc, mocker.Mock())
+
+        expected_response = {"title": "Not found."}
         assert render_response(response.data) == expected_response
 
 
@@ -201,12 +192,8 @@ class TestSerializerErrors:
             }
             assert render_response(response.data) == expected_response
 
-    def test_field_validation_error_ok(self, book, book_serializer, faker, mocker):
-        data = {
-            "isbn10": book.isbn10,
-            "pages": faker.pyint(max_value=360),
-            "title": faker.word()[:32],  # slice not to exceed max_length
-        }
+    def test_field_validation_error_ok(self, book, book_serializer, mocker):
+        data = book_data(isbn10=book.isbn10)
 
         serializer = book_serializer(data=data)
         with pytest.raises(exceptions.ValidationError):
@@ -224,12 +211,8 @@ class TestSerializerErrors:
             }
             assert render_response(response.data) == expected_response
 
-    def test_validation_error_ok(self, book_serializer, faker, mocker):
-        data = {
-            "isbn10": faker.unique.isbn10(),
-            "pages": faker.pyint(max_value=360),
-            "title": ErrorTriggers.SERIALIZER_VALIDATION.value,
-        }
+    def test_validation_error_ok(self, book_serializer, mocker):
+        data = book_data(title=ErrorTriggers.SERIALIZER_VALIDATION.value)
 
         serializer = book_serializer(data=data)
         with pytest.raises(exceptions.ValidationError):
@@ -247,13 +230,7 @@ class TestSerializerErrors:
 class TestModelSerializerErrors:
     def test_bad_choice_error_ok(self, book_model_serializer, faker, mocker, user):
         edition = faker.word()[:8]
-        data = {
-            "author": user.username,
-            "edition": edition,
-            "isbn10": faker.unique.isbn10(),
-            "pages": faker.pyint(max_value=360),
-            "title": faker.word()[:32],
-        }
+        data = book_data(author=user.username, edition=edition)
 
         serializer = book_model_serializer(data=data)
         with pytest.raises(exceptions.ValidationError):
@@ -275,12 +252,7 @@ class TestModelSerializerErrors:
         self, book_model_serializer, faker, mocker
     ):
         username = faker.user_name()
-        data = {
-            "author": username,
-            "isbn10": faker.unique.isbn10(),
-            "pages": ErrorTriggers.MODEL_CONSTRAINT.value,
-            "title": faker.word()[:32],
-        }
+        data = book_data(author=username, pages=ErrorTriggers.MODEL_CONSTRAINT.value)
 
         serializer = book_model_serializer(data=data)
         with pytest.raises(exceptions.ValidationError):
@@ -300,41 +272,41 @@ class TestModelSerializerErrors:
             assert render_response(response.data) == expected_response
 
     def test_bad_many_to_many_relationship_error_ok(
-        self, book_model_serializer, faker, mocker, user
+        self, book_model_serializer, django_assert_num_queries, faker, mocker, user
     ):
-        library_name1, library_name2 = faker.word()[:32], faker.word()[:32]
-        data = {
-            "author": user.username,
-            "isbn10": faker.unique.isbn10(),
-            "libraries": [library_name1, library_name2],
-            "pages": faker.pyint(max_value=360),
-            "title": faker.word()[:32],
-        }
+        library = LibraryFactory(name=faker.word()[:16])
+        missing_library_name = f"{library.name}-missing"
+        data = book_data(
+            author=user.username, libraries=[library.name, missing_library_name]
+        )
 
         serializer = book_model_serializer(data=data)
-        with pytest.raises(exceptions.ValidationError):
+        # one query each for the author and the isbn10 uniqueness, plus one per
+        # library slug up to the missing one, which ends the lookups
+        with django_assert_num_queries(4), pytest.raises(
+            exceptions.ValidationError
+        ) as e:
             serializer.is_valid(raise_exception=True)
-            exc = serializer.save()
-            response = exception_handler(exc, mocker.Mock())
 
-            expected_response = {
-                "title": "Validation error.",
-                "invalid_params": [
-                    {
-                        "name": "libraries",
-                        "reason": [f"Object with name={library_name1} does not exist."],
-                    }
-                ],
-            }
-            assert render_response(response.data) == expected_response
+        response = exception_handler(e.value, mocker.Mock())
 
-    def test_constraint_error_ok(self, book_model_serializer, faker, mocker, user):
-        data = {
-            "author": user.username,
-            "isbn10": faker.unique.isbn10(),
-            "pages": ErrorTriggers.MODEL_CONSTRAINT.value,
-            "title": faker.word()[:32],
+        expected_response = {
+            "title": "Validation error.",
+            "invalid_params": [
+                {
+                    "name": "libraries",
+                    "reason": [
+                        f"Object with name={missing_library_name} does not exist."
+                    ],
+                }
+            ],
         }
+        assert render_response(response.data) == expected_response
+
+    def test_constraint_error_ok(self, book_model_serializer, mocker, user):
+        data = book_data(
+            author=user.username, pages=ErrorTriggers.MODEL_CONSTRAINT.value
+        )
 
         serializer = book_model_serializer(data=data)
         with pytest.raises(ValidationError):
@@ -377,13 +349,10 @@ class TestModelSerializerErrors:
             }
             assert render_response(response.data) == expected_response
 
-    def test_method_error_ok(self, book_model_serializer, faker, mocker, user):
-        data = {
-            "author": user.username,
-            "isbn10": faker.unique.isbn10(),
-            "pages": faker.pyint(max_value=360),
-            "title": ErrorTriggers.SERIALIZER_METHOD.value,
-        }
+    def test_method_error_ok(self, book_model_serializer, mocker, user):
+        data = book_data(
+            author=user.username, title=ErrorTriggers.SERIALIZER_METHOD.value
+        )
 
         serializer = book_model_serializer(data=data)
         with pytest.raises(exceptions.ValidationError):
@@ -397,13 +366,10 @@ class TestModelSerializerErrors:
             }
             assert render_response(response.data) == expected_response
 
-    def test_validation_error_ok(self, book_model_serializer, faker, mocker, user):
-        data = {
-            "author": user.username,
-            "isbn10": faker.unique.isbn10(),
-            "pages": faker.pyint(max_value=360),
-            "title": ErrorTriggers.SERIALIZER_VALIDATION.value,
-        }
+    def test_validation_error_ok(self, book_model_serializer, mocker, user):
+        data = book_data(
+            author=user.username, title=ErrorTriggers.SERIALIZER_VALIDATION.value
+        )
 
         serializer = book_model_serializer(data=data)
         with pytest.raises(exceptions.ValidationError):
@@ -426,10 +392,46 @@ class TestUtils:
             ("first_name", "firstName"),
             ("family_tree_name", "familyTreeName"),
             ("very_long_last_name_and_first_name", "veryLongLastNameAndFirstName"),
+            ("address_line_1", "addressLine1"),
+            ("_private", "Private"),
+            ("double__underscore", "double_Underscore"),
+            ("trailing_", "trailing_"),
+            ("upper_Case", "upper_Case"),
         ],
     )
     def test_camelize(self, field_input, expected_output):
         assert utils.camelize(field_input) == expected_output
 
-    def test_flatten_dict(self):
-        pass
+    @pytest.mark.parametrize(
+        "dict_input, expected_output",
+        [
+            ({}, {}),
+            ({"key": "value"}, {"key": "value"}),
+            ({"key": {"subkey": "value"}}, {"key.subkey": "value"}),
+            (
+                {"key": {"subkey": {"subsubkey": "value"}}, "key2": "value2"},
+                {"key.subkey.subsubkey": "value", "key2": "value2"},
+            ),
+            (
+                {
+                    "key1": {"subkey1": "value1", "subkey2": {"subsubkey": "value2"}},
+                    "key2": ["value3"],
+                    "key3": {"subkey3": "value4"},
+                },
+                {
+                    "key1.subkey1": "value1",
+                    "key1.subkey2.subsubkey": "value2",
+                    "key2": ["value3"],
+                    "key3.subkey3": "value4",
+                },
+            ),
+            # ListField and DictField errors are keyed by list index
+            ({"tags": {0: ["value"]}}, {"tags.0": ["value"]}),
+        ],
+    )
+    def test_flatten_dict(self, dict_input, expected_output):
+        output = utils.flatten_dict(dict_input)
+
+        assert output == expected_output
+        # keys must keep the order of the original dictionary
+        assert list(output) == list(expected_output)
@@ -1,6 +1,8 @@
+import itertools
+import json
 from enum import Enum, unique
 
-from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 
 
 @unique
@@ -14,6 +16,25 @@ class ErrorTriggers(Enum):
         return self.value
 
 
+_renderer = JSONRenderer()
+
+
 def render_response(data: dict) -> dict:
-    response = Response(data=data)
-    return response.data
+    # render to JSON and back, so that lazy translations and `ErrorDetail`
+    # become the plain strings and containers an API client would receive
+    return json.loads(_renderer.render(data))
+
+
+_isbn10_sequence = itertools.count()
+
+
+def book_data(**kwargs) -> dict:
+    """Return valid book serializer input, updated with the given `kwargs`."""
+    # "X" check digit keeps these apart from the `BookFactory` isbn10 sequence
+    data = {
+        "isbn10": f"{next(_isbn10_sequence):09d}X",
+        "pages": 100,
+        "title": "Title",
+    }
+    data.update(kwargs)
+    return data